@@ -1,6 +1,7 @@
 """Binance Futures Testnet Trading Bot — core logic package."""
 
 from .client import BinanceClient
+from .jobs import OrderQueue
 from .orders import place_order
 
-__all__ = ["BinanceClient", "place_order"]
+__all__ = ["BinanceClient", "OrderQueue", "place_order"]
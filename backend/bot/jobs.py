@@ -0,0 +1,568 @@
+"""Durable asynchronous order queue — SQLite-backed jobs drained by a worker pool.
+
+Orders are validated up front, written to a local SQLite file and dispatched
+to the exchange in the background.  Every job for a given symbol is routed to
+the same worker, so orders for one symbol reach the exchange in the order they
+were submitted while different symbols proceed in parallel.
+
+Only one process may consume a given database at a time: an exclusive lock
+on ``<db_path>.lock`` elects the consumer, and every other process started
+against the same file only enqueues until that lock is released.
+
+Completion callbacks are tracked in the same table and delivered at least
+once: callbacks still pending when a consumer stops or dies are re-sent by
+the next one.
+"""
+import http.client
+import json
+import logging
+import queue
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+from .client import BinanceClient
+from .orders import place_order, validate_order
+from .validators import resolve_callback_address, validate_callback_url
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+DONE = "DONE"
+FAILED = "FAILED"
+
+# Callback delivery states (``callback_status`` column).
+PENDING = "PENDING"
+DELIVERED = "DELIVERED"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    seq          INTEGER PRIMARY KEY AUTOINCREMENT,
+    id           TEXT    NOT NULL UNIQUE,
+    symbol       TEXT    NOT NULL,
+    side         TEXT    NOT NULL,
+    order_type   TEXT    NOT NULL,
+    quantity     REAL    NOT NULL,
+    price        REAL,
+    stop_price   REAL,
+    callback_url TEXT,
+    callback_status   TEXT,
+    callback_attempts INTEGER NOT NULL DEFAULT 0,
+    status       TEXT    NOT NULL,
+    result       TEXT,
+    error        TEXT,
+    created_at   REAL    NOT NULL,
+    updated_at   REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_seq ON jobs (status, seq);
+"""
+
+# Columns added after the first release of the table, with their definitions.
+_MIGRATIONS = {
+    "callback_status": "TEXT",
+    "callback_attempts": "INTEGER NOT NULL DEFAULT 0",
+}
+
+_CALLBACK_PENDING_SQL = (
+    f"CASE WHEN callback_url IS NULL THEN NULL ELSE '{PENDING}' END"
+)
+
+_CALLBACK_TIMEOUT = 5.0
+_CALLBACK_THREADS = 2
+_CALLBACK_ATTEMPTS = 3
+
+
+def serialize_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the public view of a job record.
+
+    Shared by ``GET /jobs/{id}`` and the completion callback so both carry
+    the same JSON.
+    """
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "symbol": job["symbol"],
+        "side": job["side"],
+        "order_type": job["order_type"],
+        "quantity": job["quantity"],
+        "price": job["price"],
+        "stop_price": job["stop_price"],
+        "order": job["result"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+    }
+
+
+def find_job(db_path: str, job_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a job read-only, without creating or migrating the database.
+
+    Returns ``None`` if the database, or the job, does not exist.
+    """
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    try:
+        conn = sqlite3.connect(uri, uri=True)
+        try:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.OperationalError:
+        return None
+    return OrderQueue._to_dict(row) if row is not None else None
+
+
+def consumer_running(db_path: str) -> bool:
+    """Return ``True`` if some process holds the consumer lock for *db_path*."""
+    lock_file = _try_lock(db_path + ".lock")
+    if lock_file is None:
+        return True
+    _unlock(lock_file)
+    return False
+
+
+def _try_lock(path: str) -> Optional[IO[str]]:
+    """Take an exclusive lock on *path* without blocking; ``None`` if held."""
+    lock_file = open(path, "a+", encoding="utf-8")
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def _unlock(lock_file: IO[str]) -> None:
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    lock_file.close()
+
+
+def _post_json(url: str, address: str, payload: Dict[str, Any]) -> int:
+    """POST *payload* to *url* over a connection pinned to *address*.
+
+    Redirects are never followed; the response status is returned as-is.
+    The Host header and TLS certificate checks still use the URL's hostname.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "https":
+        conn: http.client.HTTPConnection = http.client.HTTPSConnection(
+            parsed.hostname, parsed.port, timeout=_CALLBACK_TIMEOUT
+        )
+    else:
+        conn = http.client.HTTPConnection(
+            parsed.hostname, parsed.port, timeout=_CALLBACK_TIMEOUT
+        )
+    # Only the TCP connect is redirected to the validated address.
+    conn._create_connection = (  # type: ignore[attr-defined]
+        lambda addr, *args, **kwargs: socket.create_connection(
+            (address, addr[1]), *args, **kwargs
+        )
+    )
+    path = parsed.path or "/"
+    if parsed.query:
+        path += "?" + parsed.query
+    try:
+        conn.request(
+            "POST",
+            path,
+            body=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+class OrderQueue:
+    """Persistent order queue with a per-symbol ordered worker pool.
+
+    Submitting only needs the database, so any process (e.g. the CLI) can
+    enqueue jobs.  Of the processes that call :meth:`start`, only the one
+    holding the consumer lock drains them; the others retry the lock every
+    *poll_interval* seconds and take over if the consumer exits.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        client_factory: Optional[Callable[[], BinanceClient]] = None,
+        workers: int = 4,
+        poll_interval: float = 1.0,
+    ) -> None:
+        self.db_path = db_path
+        self._client_factory = client_factory
+        self._workers = max(1, workers)
+        self._poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(_SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for name, definition in _MIGRATIONS.items():
+            if name not in columns:
+                self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_callback_seq ON jobs (callback_status, seq)"
+        )
+
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._inboxes: List["queue.Queue[Optional[str]]"] = []
+        self._threads: List[threading.Thread] = []
+        self._lock_file: Optional[IO[str]] = None
+        self._notifier: Optional[ThreadPoolExecutor] = None
+
+    # ------------------------------------------------------------------
+    # Submission / lookup
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: float,
+        price: Optional[float] = None,
+        stop_price: Optional[float] = None,
+        callback_url: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Validate an order and append it to the queue.
+
+        Returns:
+            The newly created job record (status ``QUEUED``).
+
+        Raises:
+            ValueError: On invalid input.
+        """
+        fields = validate_order(symbol, side, order_type, quantity, price, stop_price)
+        callback_url = validate_callback_url(callback_url)
+
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, symbol, side, order_type, quantity, price, "
+                "stop_price, callback_url, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    fields["symbol"],
+                    fields["side"],
+                    fields["order_type"],
+                    fields["quantity"],
+                    fields["price"],
+                    fields["stop_price"],
+                    callback_url,
+                    QUEUED,
+                    now,
+                    now,
+                ),
+            )
+        logger.info(
+            "Job queued — id=%s, symbol=%s, side=%s, type=%s, qty=%s",
+            job_id,
+            fields["symbol"],
+            fields["side"],
+            fields["order_type"],
+            fields["quantity"],
+        )
+        self._wakeup.set()
+        job = self.get(job_id)
+        assert job is not None
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job record for *job_id*, or ``None`` if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    # ------------------------------------------------------------------
+    # Worker pool
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the dispatcher and workers.
+
+        Jobs are only dispatched once this process holds the consumer lock.
+        """
+        if self._client_factory is None:
+            raise ValueError("A client factory is required to start the workers.")
+        if self._threads:
+            return
+
+        self._stopping.clear()
+        self._notifier = ThreadPoolExecutor(
+            max_workers=_CALLBACK_THREADS, thread_name_prefix="order-callback"
+        )
+        for index in range(self._workers):
+            inbox: "queue.Queue[Optional[str]]" = queue.Queue()
+            self._inboxes.append(inbox)
+            self._threads.append(
+                threading.Thread(
+                    target=self._work,
+                    args=(inbox,),
+                    name=f"order-worker-{index}",
+                    daemon=True,
+                )
+            )
+        self._threads.append(
+            threading.Thread(target=self._dispatch, name="order-dispatcher", daemon=True)
+        )
+        for thread in self._threads:
+            thread.start()
+        logger.info("Order queue started — %d worker(s), db=%s", self._workers, self.db_path)
+
+    def stop(self) -> None:
+        """Stop the workers; jobs not yet sent stay QUEUED for the next start.
+
+        Callbacks not yet delivered stay pending in the database and are
+        re-sent by the next consumer; only requests already in flight are
+        waited for.
+        """
+        self._stopping.set()
+        self._wakeup.set()
+        for inbox in self._inboxes:
+            inbox.put(None)
+        for thread in self._threads:
+            thread.join()
+        self._inboxes.clear()
+        self._threads.clear()
+        if self._notifier is not None:
+            self._notifier.shutdown(wait=True, cancel_futures=True)
+            self._notifier = None
+        self._release_consumer_lock()
+        logger.info("Order queue stopped.")
+
+    def _dispatch(self) -> None:
+        """Route QUEUED jobs, oldest first, to the worker owning their symbol."""
+        last_seq = 0
+        while not self._stopping.is_set():
+            if self._lock_file is None:
+                if not self._acquire_consumer_lock():
+                    self._stopping.wait(self._poll_interval)
+                    continue
+                logger.info("Consumer lock acquired — dispatching jobs from %s", self.db_path)
+                self._recover_interrupted()
+                self._resume_callbacks()
+
+            self._wakeup.clear()
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, id, symbol FROM jobs "
+                    "WHERE status = ? AND seq > ? ORDER BY seq LIMIT 500",
+                    (QUEUED, last_seq),
+                ).fetchall()
+            for row in rows:
+                lane = zlib.crc32(row["symbol"].encode()) % len(self._inboxes)
+                self._inboxes[lane].put(row["id"])
+                last_seq = row["seq"]
+            if not rows:
+                self._wakeup.wait(self._poll_interval)
+
+    def _acquire_consumer_lock(self) -> bool:
+        """Try (without blocking) to become the only consumer of the database."""
+        self._lock_file = _try_lock(self.db_path + ".lock")
+        return self._lock_file is not None
+
+    def _release_consumer_lock(self) -> None:
+        if self._lock_file is None:
+            return
+        _unlock(self._lock_file)
+        self._lock_file = None
+
+    def _recover_interrupted(self) -> None:
+        """Fail jobs left RUNNING by a previous consumer.
+
+        Only called while holding the consumer lock, so no live process can
+        still be sending them.  A RUNNING job may or may not have reached the
+        exchange before its consumer died; re-sending it could double the
+        position.
+        """
+        with self._lock:
+            interrupted = self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated_at = ?, "
+                f"callback_status = {_CALLBACK_PENDING_SQL} "
+                "WHERE status = ?",
+                (
+                    FAILED,
+                    "Interrupted before the exchange acknowledged the order; "
+                    "check open orders before resubmitting.",
+                    time.time(),
+                    RUNNING,
+                ),
+            ).rowcount
+        if interrupted:
+            logger.warning("Marked %d interrupted job(s) as FAILED.", interrupted)
+
+    def _resume_callbacks(self) -> None:
+        """Queue callbacks a previous consumer did not get to deliver."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE callback_status = ? ORDER BY seq",
+                (PENDING,),
+            ).fetchall()
+        if rows and self._notifier is not None:
+            logger.info("Resuming %d pending callback(s).", len(rows))
+            for row in rows:
+                self._notifier.submit(self._notify, row["id"])
+
+    def _work(self, inbox: "queue.Queue[Optional[str]]") -> None:
+        while True:
+            job_id = inbox.get()
+            if job_id is None or self._stopping.is_set():
+                return
+            try:
+                self._run(job_id)
+            except Exception as exc:  # noqa: BLE001
+                logger.error("Job %s crashed the worker loop: %s", job_id, exc)
+
+    def _run(self, job_id: str) -> None:
+        with self._lock:
+            claimed = self._conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (RUNNING, time.time(), job_id, QUEUED),
+            ).rowcount
+        if not claimed:
+            return
+
+        job = self.get(job_id)
+        assert job is not None
+        try:
+            response = place_order(
+                self._client_factory(),
+                job["symbol"],
+                job["side"],
+                job["order_type"],
+                job["quantity"],
+                job["price"],
+                job["stop_price"],
+            )
+            self._finish(job_id, DONE, result=response)
+            logger.info(
+                "Job done — id=%s, orderId=%s, status=%s",
+                job_id,
+                response.get("orderId"),
+                response.get("status"),
+            )
+        except Exception as exc:  # noqa: BLE001
+            self._finish(job_id, FAILED, error=str(exc))
+            logger.error("Job failed — id=%s: %s", job_id, exc)
+
+        job = self.get(job_id)
+        if (
+            job is not None
+            and job["callback_status"] == PENDING
+            and self._notifier is not None
+        ):
+            self._notifier.submit(self._notify, job_id)
+
+    def _finish(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ?, "
+                f"callback_status = {_CALLBACK_PENDING_SQL} "
+                "WHERE id = ? AND status = ?",
+                (
+                    status,
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                    RUNNING,
+                ),
+            )
+
+    def _notify(self, job_id: str) -> None:
+        """POST a finished job to its callback URL, retrying with back-off.
+
+        Every attempt is recorded in the database.  Anything but a 2xx answer,
+        including a redirect, counts as a failed delivery.  If the queue is
+        stopping, the callback is left PENDING for the next consumer.
+        """
+        job = self.get(job_id)
+        if job is None or job["callback_status"] != PENDING:
+            return
+        for attempt in range(job["callback_attempts"] + 1, _CALLBACK_ATTEMPTS + 1):
+            if self._stopping.is_set():
+                return
+            self._update_callback(job_id, PENDING, attempt)
+            try:
+                # Re-check at send time: DNS may have changed since submission.
+                address = resolve_callback_address(job["callback_url"])
+            except ValueError as exc:
+                self._update_callback(job_id, FAILED, attempt)
+                logger.warning("Callback for job %s skipped: %s", job_id, exc)
+                return
+            try:
+                status = _post_json(job["callback_url"], address, serialize_job(job))
+                if 200 <= status < 300:
+                    self._update_callback(job_id, DELIVERED, attempt)
+                    return
+                raise OSError(f"HTTP {status}")
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Callback for job %s failed (attempt %d/%d): %s",
+                    job_id,
+                    attempt,
+                    _CALLBACK_ATTEMPTS,
+                    exc,
+                )
+            if attempt < _CALLBACK_ATTEMPTS:
+                self._stopping.wait(2 ** attempt)
+        if not self._stopping.is_set():
+            self._update_callback(job_id, FAILED, _CALLBACK_ATTEMPTS)
+
+    def _update_callback(self, job_id: str, status: str, attempts: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET callback_status = ?, callback_attempts = ? WHERE id = ?",
+                (status, attempts, job_id),
+            )
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = {key: row[key] for key in row.keys() if key != "seq"}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
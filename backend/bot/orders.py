@@ -15,6 +15,36 @@ from .validators import (
 logger = logging.getLogger(__name__)
 
 
+def validate_order(
+    symbol: str,
+    side: str,
+    order_type: str,
+    quantity: float,
+    price: Optional[float] = None,
+    stop_price: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Validate and normalise order inputs without touching the exchange.
+
+    Returns:
+        Dict with ``symbol``, ``side``, ``order_type``, ``quantity``,
+        ``price`` and ``stop_price`` keys, normalised for the client.
+
+    Raises:
+        ValueError: On invalid input.
+    """
+    symbol = validate_symbol(symbol)
+    side = validate_side(side)
+    order_type = validate_order_type(order_type)
+    return {
+        "symbol": symbol,
+        "side": side,
+        "order_type": order_type,
+        "quantity": validate_quantity(quantity),
+        "price": validate_price(price, order_type),
+        "stop_price": validate_stop_price(stop_price, order_type),
+    }
+
+
 def place_order(
     client: BinanceClient,
     symbol: str,
@@ -42,12 +72,13 @@ def place_order(
         ValueError: On invalid input.
         ccxt.BaseError: On API-level or network-level errors.
     """
-    symbol = validate_symbol(symbol)
-    side = validate_side(side)
-    order_type = validate_order_type(order_type)
-    quantity = validate_quantity(quantity)
-    price = validate_price(price, order_type)
-    stop_price = validate_stop_price(stop_price, order_type)
+    fields = validate_order(symbol, side, order_type, quantity, price, stop_price)
+    symbol = fields["symbol"]
+    side = fields["side"]
+    order_type = fields["order_type"]
+    quantity = fields["quantity"]
+    price = fields["price"]
+    stop_price = fields["stop_price"]
 
     logger.info(
         "Order request — symbol=%s, side=%s, type=%s, qty=%s, price=%s, stopPrice=%s",
@@ -1,5 +1,9 @@
 """Input validation helpers for the trading bot."""
+import ipaddress
+import os
+import socket
 from typing import Optional
+from urllib.parse import urlparse
 
 VALID_SIDES = {"BUY", "SELL"}
 VALID_ORDER_TYPES = {"MARKET", "LIMIT", "STOP"}
@@ -75,3 +79,66 @@ def validate_stop_price(
                 "for STOP (stop-limit) orders."
             )
     return stop_price
+
+
+def validate_callback_url(callback_url: Optional[str]) -> Optional[str]:
+    """Validate an optional completion webhook URL.
+
+    See :func:`resolve_callback_address` for the rules applied.
+    """
+    if callback_url is None:
+        return None
+    resolve_callback_address(callback_url)
+    return callback_url
+
+
+def resolve_callback_address(callback_url: str) -> str:
+    """Validate a webhook URL and return the IP address to connect to.
+
+    Must be an absolute ``http://`` or ``https://`` URL.  If the
+    ``ORDER_CALLBACK_HOSTS`` env-var (comma-separated hostnames) is set, the
+    host must be one of them; otherwise every address the host resolves to
+    must be public, so callers cannot make the server POST to loopback,
+    link-local or private-network services.  Connecting to the returned
+    address (rather than resolving the name again) keeps DNS rebinding from
+    slipping past the check.
+    """
+    parsed = urlparse(callback_url)
+    host = parsed.hostname
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+        host = None
+    if parsed.scheme not in ("http", "https") or not host:
+        raise ValueError(
+            f"Invalid callback URL: '{callback_url}'. "
+            "Must be an absolute http:// or https:// URL."
+        )
+
+    allowed_hosts = {
+        h.strip().lower()
+        for h in os.getenv("ORDER_CALLBACK_HOSTS", "").split(",")
+        if h.strip()
+    }
+    if allowed_hosts and host.lower() not in allowed_hosts:
+        raise ValueError(
+            f"Callback host '{host}' is not listed in ORDER_CALLBACK_HOSTS."
+        )
+
+    try:
+        addr_infos = socket.getaddrinfo(host, port, proto=socket.IPPROTO_TCP)
+    except (socket.gaierror, UnicodeError):
+        raise ValueError(f"Callback host '{host}' cannot be resolved.")
+    addresses = [addr_info[4][0].split("%")[0] for addr_info in addr_infos]
+    if not allowed_hosts:
+        for raw in addresses:
+            address = ipaddress.ip_address(raw)
+            if address.version == 6 and address.ipv4_mapped is not None:
+                address = address.ipv4_mapped
+            if not address.is_global or address.is_multicast:
+                raise ValueError(
+                    f"Callback host '{host}' resolves to non-public address "
+                    f"{address}; set ORDER_CALLBACK_HOSTS to allow it explicitly."
+                )
+    return addresses[0]
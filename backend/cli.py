@@ -1,18 +1,24 @@
 #!/usr/bin/env python3
 """CLI entry point — place orders and check balance on Binance Futures Testnet."""
+import os
 import sys
+import time
+from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 import typer
 from dotenv import load_dotenv
 
 from bot.client import BinanceClient
+from bot.jobs import OrderQueue, consumer_running, find_job
 from bot.logging_config import setup_logging
 from bot.orders import place_order as _place_order
 
 load_dotenv()
 
 LOG_FILE = "app.log"
+QUEUE_DB = os.getenv("ORDER_QUEUE_DB", str(Path(__file__).parent / "orders.db"))
 logger = setup_logging(LOG_FILE)
 
 app = typer.Typer(
@@ -45,6 +51,30 @@ def _print_response(response: dict) -> None:
     typer.echo(f"{_DIVIDER}\n")
 
 
+def _print_job(job: dict) -> None:
+    updated = datetime.fromtimestamp(job["updated_at"]).strftime("%Y-%m-%d %H:%M:%S")
+    typer.echo(f"\n{_DIVIDER}")
+    typer.echo("  Job Status")
+    typer.echo(_DIVIDER)
+    typer.echo(f"  Job ID        : {job['id']}")
+    typer.echo(f"  Status        : {job['status']}")
+    typer.echo(f"  Symbol        : {job['symbol']}")
+    typer.echo(f"  Side          : {job['side']}")
+    typer.echo(f"  Type          : {job['order_type']}")
+    typer.echo(f"  Quantity      : {job['quantity']}")
+    typer.echo(f"  Updated       : {updated}")
+    if job["error"]:
+        typer.echo(f"  Error         : {job['error']}")
+    if job["callback_url"]:
+        typer.echo(
+            f"  Callback      : {job.get('callback_status') or 'N/A'} "
+            f"({job.get('callback_attempts', 0)} attempt(s))"
+        )
+    typer.echo(f"{_DIVIDER}\n")
+    if job["result"]:
+        _print_response(job["result"])
+
+
 # ---------------------------------------------------------------------------
 # Commands
 # ---------------------------------------------------------------------------
@@ -62,6 +92,13 @@ def order(
     stop_price: Optional[float] = typer.Option(
         None, "--stop-price", help="Stop trigger price — required for STOP orders"
     ),
+    async_mode: bool = typer.Option(
+        False, "--async",
+        help="Queue the order and return a job ID; `worker` or the API server sends it",
+    ),
+    callback_url: Optional[str] = typer.Option(
+        None, "--callback-url", help="With --async: URL to POST the finished job to"
+    ),
 ) -> None:
     """Place a futures order on Binance Futures Testnet."""
     typer.echo(f"\n{_DIVIDER}")
@@ -78,6 +115,28 @@ def order(
     typer.echo(f"{_DIVIDER}\n")
 
     try:
+        if callback_url is not None and not async_mode:
+            raise ValueError("--callback-url requires --async.")
+        if async_mode:
+            job = OrderQueue(QUEUE_DB).submit(
+                symbol, side, order_type, quantity, price, stop_price, callback_url
+            )
+            typer.echo(
+                typer.style("⏳  Order queued!", fg=typer.colors.GREEN, bold=True)
+            )
+            typer.echo(f"  Job ID : {job['id']}")
+            typer.echo(f"  Check  : python cli.py job {job['id']}\n")
+            if not consumer_running(QUEUE_DB):
+                typer.echo(
+                    typer.style(
+                        "⚠️   No worker is draining the queue — the order is sent once "
+                        "`python cli.py worker` or the API server is running.",
+                        fg=typer.colors.YELLOW,
+                        bold=True,
+                    )
+                )
+            return
+
         client = BinanceClient()
         response = _place_order(client, symbol, side, order_type, quantity, price, stop_price)
         typer.echo(
@@ -100,6 +159,57 @@ def order(
         raise typer.Exit(code=1)
 
 
+@app.command()
+def job(job_id: str = typer.Argument(..., help="Job ID returned by order --async")) -> None:
+    """Show the status of an order queued with --async."""
+    record = find_job(QUEUE_DB, job_id)
+    if record is None:
+        typer.echo(
+            typer.style(f"❌  Job '{job_id}' not found.", fg=typer.colors.RED, bold=True),
+            err=True,
+        )
+        raise typer.Exit(code=1)
+    _print_job(record)
+
+
+@app.command()
+def worker(
+    workers: int = typer.Option(
+        int(os.getenv("ORDER_QUEUE_WORKERS", "4")),
+        help="Number of worker threads sending orders",
+    ),
+) -> None:
+    """Send orders queued with --async until interrupted (Ctrl+C)."""
+    try:
+        client = BinanceClient()
+    except ValueError as exc:
+        logger.error("Validation error: %s", exc)
+        typer.echo(
+            typer.style(f"❌  Validation Error: {exc}", fg=typer.colors.RED, bold=True),
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    if consumer_running(QUEUE_DB):
+        typer.echo(
+            typer.style(
+                "⚠️   Another process is draining the queue — waiting to take over.",
+                fg=typer.colors.YELLOW,
+                bold=True,
+            )
+        )
+    order_queue = OrderQueue(QUEUE_DB, client_factory=lambda: client, workers=workers)
+    order_queue.start()
+    typer.echo(f"Worker running on {QUEUE_DB} — press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        order_queue.stop()
+
+
 @app.command()
 def balance() -> None:
     """Fetch and display the futures account balance."""
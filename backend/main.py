@@ -1,28 +1,43 @@
 #!/usr/bin/env python3
 """FastAPI server — bridges the Python trading-bot backend to the frontend."""
 import os
+from contextlib import asynccontextmanager
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
 from bot.client import BinanceClient
+from bot.jobs import OrderQueue, serialize_job
 from bot.logging_config import setup_logging
 from bot.orders import place_order as _place_order
 
 load_dotenv()
 
 LOG_FILE = str(Path(__file__).parent / "app.log")
+QUEUE_DB = os.getenv("ORDER_QUEUE_DB", str(Path(__file__).parent / "orders.db"))
+QUEUE_WORKERS = int(os.getenv("ORDER_QUEUE_WORKERS", "4"))
 logger = setup_logging(LOG_FILE)
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Run the async order-queue workers for the lifetime of the server."""
+    _get_order_queue().start()
+    yield
+    _get_order_queue().stop()
+
+
 app = FastAPI(
     title="PrimetradeAI – Binance Futures Bot",
     description="REST API that wraps Binance Futures Demo Trading order placement.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Allow all origins so the frontend (any port / domain) can talk to this server.
@@ -46,6 +61,12 @@ def _get_client() -> BinanceClient:
     return BinanceClient()
 
 
+@lru_cache(maxsize=1)
+def _get_order_queue() -> OrderQueue:
+    """Return the shared OrderQueue (also drains jobs queued by the CLI)."""
+    return OrderQueue(QUEUE_DB, client_factory=_get_client, workers=QUEUE_WORKERS)
+
+
 # ---------------------------------------------------------------------------
 # Schemas
 # ---------------------------------------------------------------------------
@@ -66,6 +87,10 @@ class OrderRequest(BaseModel):
         None, gt=0, examples=[29000.0],
         description="Stop trigger price (required for STOP orders)",
     )
+    callback_url: Optional[str] = Field(
+        None, examples=["https://hooks.example.com/order"],
+        description="Async mode only — URL that receives a POST when the job finishes",
+    )
 
 
 class OrderResponse(BaseModel):
@@ -73,6 +98,25 @@ class OrderResponse(BaseModel):
     order: Dict[str, Any]
 
 
+class JobResponse(BaseModel):
+    job_id: str
+    status: str
+    symbol: str
+    side: str
+    order_type: str
+    quantity: float
+    price: Optional[float] = None
+    stop_price: Optional[float] = None
+    order: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float
+    updated_at: float
+
+
+def _job_response(job: Dict[str, Any]) -> JobResponse:
+    return JobResponse(**serialize_job(job))
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -99,9 +143,50 @@ def get_balance() -> Dict[str, List[Dict[str, Any]]]:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
-@app.post("/order", response_model=OrderResponse, tags=["Orders"])
-def create_order(order: OrderRequest) -> OrderResponse:
-    """Place a MARKET or LIMIT futures order on Binance Testnet."""
+@app.post(
+    "/order",
+    response_model=OrderResponse,
+    responses={202: {"model": JobResponse, "description": "Order queued (async mode)"}},
+    tags=["Orders"],
+)
+def create_order(
+    order: OrderRequest,
+    async_mode: bool = Query(
+        False, alias="async",
+        description="Queue the order and return 202 with a job ID instead of waiting",
+    ),
+) -> Any:
+    """Place a MARKET, LIMIT, or STOP futures order on Binance Demo Trading.
+
+    By default the request waits for the exchange and returns the order.
+    With ``?async=true`` the order is validated, queued and answered with
+    ``202 Accepted`` plus a job ID; poll ``GET /jobs/{id}`` or pass
+    ``callback_url`` to be notified when it completes.
+    """
+    if order.callback_url is not None and not async_mode:
+        raise HTTPException(
+            status_code=422, detail="callback_url is only supported with ?async=true."
+        )
+    if async_mode:
+        try:
+            job = _get_order_queue().submit(
+                order.symbol,
+                order.side,
+                order.order_type,
+                order.quantity,
+                order.price,
+                order.stop_price,
+                order.callback_url,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+        logger.info("/order — queued job %s", job["id"])
+        return JSONResponse(
+            status_code=202,
+            content=_job_response(job).model_dump(),
+            headers={"Location": f"/jobs/{job['id']}"},
+        )
+
     try:
         client = _get_client()
         response = _place_order(
@@ -138,6 +223,15 @@ def create_order(order: OrderRequest) -> OrderResponse:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@app.get("/jobs/{job_id}", response_model=JobResponse, tags=["Orders"])
+def get_job(job_id: str) -> JobResponse:
+    """Return the status (and exchange response, once done) of a queued order."""
+    job = _get_order_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    return _job_response(job)
+
+
 @app.get("/logs", tags=["Logs"])
 def get_logs(lines: int = 100) -> Dict[str, List[str]]:
     """Return the last *lines* entries from app.log."""